@@ -0,0 +1,75 @@
+# cython: language_level=3
+"""
+Compiled version of the indented tree parser used by Directory Tree Creator.
+
+Build it in place with `cythonize -i _parser.pyx`; when the extension is not
+built the pure Python parse_indented_tree in directory-tree-creator.py is used.
+Both implementations must produce the same result.
+"""
+
+import os
+
+from cpython.unicode cimport Py_UNICODE_ISSPACE
+
+
+cpdef list parse_indented_tree(str tree_text):
+    """
+    Parse a simple indented text-based tree representation into a flat list of entries.
+
+    Args:
+        tree_text (str): The indented text representation of the directory tree
+
+    Returns:
+        list: (depth, is_dir, path) tuples in input order, with paths relative to the tree root
+    """
+    cdef list lines = tree_text.strip().split('\n')
+    cdef list entries = []
+    # (indentation, path prefix) of every open directory, innermost last
+    cdef list stack = [(-1, '')]
+    cdef str sep = os.sep
+    cdef str line, name, path
+    cdef Py_ssize_t n, indent, end
+    cdef bint is_dir
+
+    for line in lines:
+        n = len(line)
+
+        # Calculate the indentation level (number of leading whitespace characters)
+        indent = 0
+        while indent < n and Py_UNICODE_ISSPACE(line[indent]):
+            indent += 1
+
+        # Skip empty lines
+        if indent == n:
+            continue
+
+        # Skip comments, they never become entries
+        if line[indent] == u'#':
+            continue
+
+        # Find the end of the stripped line
+        end = n
+        while Py_UNICODE_ISSPACE(line[end - 1]):
+            end -= 1
+
+        # Determine if it's a directory or file
+        is_dir = line[end - 1] == u'/'
+        name = line[indent:end - 1] if is_dir else line[indent:end]
+
+        # Validate name
+        if not name or '/' in name or '\\' in name:
+            raise ValueError(f"Invalid name: '{name}'. Names cannot contain '/' or '\\'.")
+
+        # Close directories that are not ancestors of this line
+        while indent <= <Py_ssize_t>stack[-1][0]:
+            stack.pop()
+
+        # Add the new entry below its parent directory
+        path = <str>stack[-1][1] + name
+        entries.append((len(stack) - 1, is_dir, path))
+
+        # Open the directory so deeper lines are added to it
+        if is_dir:
+            stack.append((indent, path + sep))
+
+    return entries
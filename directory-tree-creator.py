@@ -6,152 +6,201 @@ This application creates a directory structure based on text-based tree represen
 It supports both indented format and ASCII tree format (like output from the 'tree' command).
 """
 
+import ctypes
+import errno
+import mmap
 import os
+import queue
 import re
+import struct
 import sys
+import threading
 import tkinter as tk
+import tkinter.font as tkfont
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 
 
+# Branch marker in an ASCII tree line ('├──', '└──', ...)
+_ASCII_BRANCH_RE = re.compile(r'[│├└](?:──|─)')
+# Separators inside a multi-part ASCII tree name ('src/utils/helpers.py')
+_NAME_SEPARATOR_RE = re.compile(r'[/\\]')
+
+# Flags and mode used to create (or truncate) an empty file
+_NEW_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+_NEW_FILE_MODE = 0o666
+
+# Minimum number of sibling entries worth handing to a thread pool
+_PARALLEL_THRESHOLD = 32
+
+# Report progress once per this many created entries
+_PROGRESS_BATCH = 64
+# Interval at which the Tk thread applies progress queued by the worker, in ms
+_PROGRESS_POLL_MS = 50
+# Queued by the worker thread once creation is over, paired with the error if any
+_CREATION_FINISHED = object()
+
+
 def parse_indented_tree(tree_text):
     """
-    Parse a simple indented text-based tree representation into a nested dictionary.
+    Parse a simple indented text-based tree representation into a flat list of entries.
     
     Args:
         tree_text (str): The indented text representation of the directory tree
         
     Returns:
-        dict: A nested dictionary representing the directory structure
+        list: (depth, is_dir, path) tuples in input order, with paths relative to the tree root
     """
     lines = tree_text.strip().split('\n')
-    root = {}
-    path_stack = []
-    indent_stack = [-1]
+    entries = []
+    # (indentation, path prefix) of every open directory, innermost last
+    stack = [(-1, '')]
+    # Bind hot lookups to locals once instead of resolving them on every line
+    add_entry = entries.append
+    open_dir = stack.append
+    close_dir = stack.pop
+    sep = os.sep
     
     for line in lines:
+        # Strip each side once: the leading part gives the indentation level
+        content = line.lstrip()
+        
         # Skip empty lines
-        if not line.strip():
+        if not content:
+            continue
+        
+        indent = len(line) - len(content)
+        line = content.rstrip()
+        
+        # Skip comments, they never become entries
+        if line.startswith('#'):
             continue
-            
-        # Calculate the indentation level (number of spaces)
-        indent = len(line) - len(line.lstrip())
-        line = line.strip()
         
         # Determine if it's a directory or file
         is_dir = line.endswith('/')
         name = line[:-1] if is_dir else line
         
         # Validate name
-        if not name or ('/' in name and not name.startswith('#')) or ('\\' in name and not name.startswith('#')):
+        if not name or '/' in name or '\\' in name:
             raise ValueError(f"Invalid name: '{name}'. Names cannot contain '/' or '\\'.")
         
-        # Adjust the path stack based on indentation
-        while indent <= indent_stack[-1]:
-            indent_stack.pop()
-            path_stack.pop()
+        # Close directories that are not ancestors of this line
+        while indent <= stack[-1][0]:
+            close_dir()
         
-        # Update the current path
-        if not path_stack:
-            # This is the root
-            current = root
-        else:
-            # Navigate to the current position in the nested dict
-            current = root
-            for p in path_stack:
-                if p not in current:
-                    current[p] = {}
-                current = current[p]
+        # Add the new entry below its parent directory
+        path = stack[-1][1] + name
+        add_entry((len(stack) - 1, is_dir, path))
         
-        # Add the new entry
-        current[name] = {} if is_dir else None
-        
-        # Update stacks if this is a directory
+        # Open the directory so deeper lines are added to it
         if is_dir:
-            path_stack.append(name)
-            indent_stack.append(indent)
+            open_dir((indent, path + sep))
     
-    return root
+    return entries
 
 
 def parse_ascii_tree(tree_text):
     """
     Parse an ASCII tree representation (like the one from 'tree' command)
-    into a nested dictionary.
+    into a flat list of entries.
     
     Args:
         tree_text (str): The ASCII text representation of the directory tree
         
     Returns:
-        dict: A nested dictionary representing the directory structure
+        list: (depth, is_dir, path) tuples in input order, with paths relative to the tree root
     """
     lines = tree_text.strip().split('\n')
-    root = {}
+    entries = []
     
     if not lines:
-        return root
+        return entries
     
     # First line is the root directory
     root_line = lines[0].strip()
-    if root_line.endswith('/'):
-        root_name = root_line[:-1]
-    else:
+    if not root_line.endswith('/'):
         # If the root doesn't end with /, we'll create a fake root
-        root_name = "root"
-        lines.insert(0, root_name + "/")
+        lines.insert(0, "root/")
     
-    # Initialize structure
-    structure = {root_name: {}}
-    path_stack = [root_name]
+    # (branch column, path prefix, depth) of every open directory, starting with the root itself
+    stack = [(-1, '', -1)]
+    # Bind hot lookups to locals once instead of resolving them on every line
+    find_branch = _ASCII_BRANCH_RE.search
+    split_name = _NAME_SEPARATOR_RE.split
+    add_entry = entries.append
+    open_dir = stack.append
+    close_dir = stack.pop
+    sep = os.sep
     
     # Parse the rest of the lines
     for i in range(1, len(lines)):
         line = lines[i]
-        if not line.strip():
-            continue
         
-        # Extract path depth from the ASCII tree
-        # We'll check for '│', '├', '└', and '─' characters
-        depth = 0
+        # Locate the branch marker; its column tells how deep the entry is.
+        # Lines without one are direct children of the root, placed left of
+        # any marker so that marked lines can still nest under them
+        column = -0.5
         content_start = 0
-        
-        # Match ASCII tree characters to determine the depth
-        match = re.search(r'[│├└](?:──|─)', line)
+        match = find_branch(line)
         if match:
+            column = match.start()
             content_start = match.end()
-            # Count path segments
-            depth = line[:match.end()].count('│') + line[:match.end()].count('├') + line[:match.end()].count('└')
         
-        # Extract the name and comment
+        # Extract the name
         content = line[content_start:].strip()
-        comment = ""
         
-        # Check if there's a comment
-        if '#' in content:
-            parts = content.split('#', 1)
-            content = parts[0].strip()
-            comment = parts[1].strip()
+        # Skip empty lines, bare branch markers and '│' spacer lines
+        if not content.strip('│ \t'):
+            continue
+        
+        # Skip comment-only lines, they never become entries
+        if content.startswith('#'):
+            continue
+        
+        # Drop a trailing comment
+        content = content.split('#', 1)[0].strip()
         
         # Determine if it's a directory
         is_dir = content.endswith('/')
         name = content[:-1] if is_dir else content
         
-        # Adjust the path stack based on depth
-        while len(path_stack) > depth + 1:
-            path_stack.pop()
-        
-        # Navigate to current position in the nested dict
-        current = structure
-        for p in path_stack:
-            current = current[p]
-        
-        # Add the new entry
-        current[name] = {} if is_dir else None
+        # Close directories whose branch column is not left of this one, which
+        # works for any indent width ('│   ├── ', '│  ├─ ', ...)
+        while column <= stack[-1][0]:
+            close_dir()
         
-        # Update path stack if this is a directory
+        # A multi-part name ('src/utils/helpers.py') implies its intermediate
+        # directories, which are added first so parents are always planned
+        parts = [part for part in split_name(name) if part]
+        if not parts:
+            continue
+        _, path, depth = stack[-1]
+        for part in parts[:-1]:
+            path += part
+            depth += 1
+            add_entry((depth, True, path))
+            path += sep
+        
+        # Add the new entry below its parent directory
+        path += parts[-1]
+        depth += 1
+        add_entry((depth, is_dir, path))
+        
+        # Open the directory so deeper lines are added to it
         if is_dir:
-            path_stack.append(name)
+            open_dir((column, path + sep, depth))
     
-    return structure[root_name] if root_name in structure else {}
+    return entries
+
+
+try:
+    # Optional compiled parser, built with `cythonize -i _parser.pyx`
+    from _parser import parse_indented_tree as _compiled_parse_indented_tree
+except ImportError:
+    _compiled_parse_indented_tree = None
+
+# Parser used for indented trees: the compiled one when it has been built
+_indented_tree_parser = _compiled_parse_indented_tree or parse_indented_tree
 
 
 def detect_format_and_parse(tree_text):
@@ -162,75 +211,442 @@ def detect_format_and_parse(tree_text):
         tree_text (str): The text representation of the directory tree
         
     Returns:
-        tuple: (dict - structure, str - format type)
+        tuple: (list - entries, str - format type)
     """
     # Check if it contains ASCII tree characters
     if any(char in tree_text for char in ['├', '└', '│', '─']):
         return parse_ascii_tree(tree_text), "ASCII tree"
     else:
-        return parse_indented_tree(tree_text), "Indented"
+        return _indented_tree_parser(tree_text), "Indented"
+
+
+# io_uring syscall numbers are shared by every Linux architecture
+_SYS_IO_URING_SETUP = 425
+_SYS_IO_URING_ENTER = 426
+_SYS_IO_URING_REGISTER = 427
+
+_IORING_OFF_SQ_RING = 0
+_IORING_OFF_CQ_RING = 0x8000000
+_IORING_OFF_SQES = 0x10000000
+_IORING_ENTER_GETEVENTS = 1
+_IORING_REGISTER_FILES = 2
+_IORING_REGISTER_PROBE = 8
+_IO_URING_OP_SUPPORTED = 1
+_IOSQE_IO_LINK = 4
+
+_IORING_OP_OPENAT = 18
+_IORING_OP_CLOSE = 19
+_IORING_OP_MKDIRAT = 37
+
+_AT_FDCWD = -100
+
+# Keep batches small: deeper queues only add latency variance for metadata ops
+_IO_URING_BATCH = 32
+# Each file takes an openat SQE plus a linked close SQE
+_IO_URING_ENTRIES = 2 * _IO_URING_BATCH
 
+# Longest path accepted by the kernel, including the terminating NUL
+_PATH_MAX = 4096
 
-def create_directory_structure(base_path, structure, update_callback=None):
+# struct io_uring_params, struct io_uring_sqe and struct io_uring_cqe
+_PARAMS_SIZE = 120
+_SQE = struct.Struct('=BBHiQQIIQHHiQQ')
+_CQE = struct.Struct('=QiI')
+_U32 = struct.Struct('=I')
+
+
+class _IoUring:
     """
-    Create the directory structure based on the nested dictionary.
+    A minimal io_uring instance driven through raw syscalls.
     
-    Args:
-        base_path (str): The base path where the structure will be created
-        structure (dict): A nested dictionary representing the directory structure
-        update_callback (callable): Optional callback to update UI with progress
+    liburing's SQE helpers are inline functions, so they can't be reached
+    through ctypes; this class fills the shared rings directly instead.
     """
-    items_created = 0
-    total_items = count_items(structure)
     
-    for name, contents in structure.items():
-        # Skip comments (entries starting with #)
-        if name.startswith('#'):
-            continue
+    def __init__(self, libc, entries=_IO_URING_ENTRIES):
+        self._libc = libc
+        params = ctypes.create_string_buffer(_PARAMS_SIZE)
+        fd = libc.syscall(_SYS_IO_URING_SETUP, entries, params)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.fd = fd
+        
+        sq_entries, cq_entries = struct.unpack_from('=II', params, 0)
+        # The ring offsets locate the shared head/tail/mask words inside each mapping
+        (self._sq_head, self._sq_tail, sq_mask, _, _, _,
+         self._sq_array) = struct.unpack_from('=7I', params, 40)
+        (self._cq_head, self._cq_tail, cq_mask, _, _,
+         self._cqes) = struct.unpack_from('=6I', params, 80)
+        self.entries = sq_entries
+        
+        try:
+            prot = mmap.PROT_READ | mmap.PROT_WRITE
+            self._sq = mmap.mmap(fd, self._sq_array + sq_entries * 4, mmap.MAP_SHARED,
+                                 prot, offset=_IORING_OFF_SQ_RING)
+            self._cq = mmap.mmap(fd, self._cqes + cq_entries * _CQE.size, mmap.MAP_SHARED,
+                                 prot, offset=_IORING_OFF_CQ_RING)
+            self._sqes = mmap.mmap(fd, sq_entries * _SQE.size, mmap.MAP_SHARED,
+                                   prot, offset=_IORING_OFF_SQES)
+        except Exception:
+            os.close(fd)
+            raise
+        self._sq_mask, = _U32.unpack_from(self._sq, sq_mask)
+        self._cq_mask, = _U32.unpack_from(self._cq, cq_mask)
+        
+        # One path buffer per SQE, allocated once and reused by every batch
+        self._path_buffers = [ctypes.create_string_buffer(_PATH_MAX) for _ in range(sq_entries)]
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """Unmap the rings and close the io_uring file descriptor"""
+        self._sqes.close()
+        self._cq.close()
+        self._sq.close()
+        os.close(self.fd)
+    
+    def supports(self, *opcodes):
+        """Check whether the running kernel implements all the given opcodes"""
+        # struct io_uring_probe: 16 byte header followed by 8 byte io_uring_probe_op entries
+        probe = ctypes.create_string_buffer(16 + 256 * 8)
+        if self._libc.syscall(_SYS_IO_URING_REGISTER, self.fd, _IORING_REGISTER_PROBE, probe, 256) < 0:
+            return False
+        last_op = probe[0][0]
+        for opcode in opcodes:
+            if opcode > last_op:
+                return False
+            flags, = struct.unpack_from('=H', probe, 16 + opcode * 8 + 2)
+            if not flags & _IO_URING_OP_SUPPORTED:
+                return False
+        return True
+    
+    def register_file_slots(self, count):
+        """
+        Register a sparse table of fixed file slots for direct descriptors.
+        
+        Files opened into these slots never enter the process file table and
+        can be closed by a linked SQE in the same submission.
+        
+        Returns:
+            bool: True if the table was registered
+        """
+        fds = (ctypes.c_int * count)(*([-1] * count))
+        return self._libc.syscall(_SYS_IO_URING_REGISTER, self.fd, _IORING_REGISTER_FILES, fds, count) >= 0
+    
+    def path_addresses(self, paths):
+        """
+        Copy a batch of paths into the preallocated path buffers.
+        
+        Args:
+            paths (list): The paths used by the next batch, at most `entries` long
             
-        path = os.path.join(base_path, name)
+        Returns:
+            list: The address of each NUL-terminated path, valid until the next call
+        """
+        addresses = []
+        fsencode = os.fsencode
+        addressof = ctypes.addressof
+        for buf, path in zip(self._path_buffers, paths):
+            encoded = fsencode(path)
+            if len(encoded) >= _PATH_MAX:
+                raise OSError(errno.ENAMETOOLONG, os.strerror(errno.ENAMETOOLONG), path)
+            buf.value = encoded
+            addresses.append(addressof(buf))
+        return addresses
+    
+    def submit_and_wait(self, sqes):
+        """
+        Submit a batch of SQEs and wait for all of them to complete.
+        
+        Args:
+            sqes (list): Tuples of (opcode, flags, fd, addr, length, op_flags, file_index),
+                at most `entries` long
+            
+        Returns:
+            list: The CQE result of each SQE, in submission order
+        """
+        sq, sq_array, sq_mask, sqes_map = self._sq, self._sq_array, self._sq_mask, self._sqes
+        pack_sqe = _SQE.pack_into
+        pack_u32 = _U32.pack_into
+        tail, = _U32.unpack_from(sq, self._sq_tail)
+        for i, (opcode, flags, fd, addr, length, op_flags, file_index) in enumerate(sqes):
+            index = (tail + i) & sq_mask
+            pack_sqe(sqes_map, index * _SQE.size,
+                     opcode, flags, 0, fd, 0, addr, length, op_flags, i, 0, 0, file_index, 0, 0)
+            pack_u32(sq, sq_array + index * 4, index)
+        pack_u32(sq, self._sq_tail, (tail + len(sqes)) & 0xFFFFFFFF)
+        
+        submitted = self._enter(len(sqes), len(sqes))
+        if submitted != len(sqes):
+            # Waiting for completions that were never submitted would block forever
+            raise RuntimeError(f"io_uring accepted only {submitted} of {len(sqes)} operations")
+        
+        # The wait can end early (e.g. interrupted by a signal) while operations
+        # are still in flight, so keep reaping until every one has completed
+        results = [None] * len(sqes)
+        remaining = len(sqes)
+        head, = _U32.unpack_from(self._cq, self._cq_head)
+        while True:
+            tail, = _U32.unpack_from(self._cq, self._cq_tail)
+            while head != tail:
+                user_data, res, _ = _CQE.unpack_from(self._cq, self._cqes + (head & self._cq_mask) * _CQE.size)
+                if results[user_data] is None:
+                    remaining -= 1
+                results[user_data] = res
+                head = (head + 1) & 0xFFFFFFFF
+            _U32.pack_into(self._cq, self._cq_head, head)
+            if not remaining:
+                return results
+            self._enter(0, remaining)
+    
+    def _enter(self, to_submit, min_complete):
+        """
+        Call io_uring_enter, retrying when a signal interrupts it.
         
-        if contents is None:
-            # This is a file
-            status = f"Creating file: {path}"
+        Args:
+            to_submit (int): Number of queued SQEs to submit
+            min_complete (int): Number of completions to wait for
+            
+        Returns:
+            int: The number of SQEs the kernel accepted
+        """
+        while True:
+            ret = self._libc.syscall(_SYS_IO_URING_ENTER, self.fd, to_submit, min_complete,
+                                     _IORING_ENTER_GETEVENTS, None, 0)
+            if ret >= 0:
+                return ret
+            err = ctypes.get_errno()
+            if err != errno.EINTR:
+                raise OSError(err, os.strerror(err))
+
+
+def _open_io_uring():
+    """
+    Set up an io_uring instance for batched file creation.
+    
+    Returns:
+        _IoUring: A ring supporting mkdirat/openat/close, or None if io_uring is unavailable
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        ring = _IoUring(ctypes.CDLL(None, use_errno=True))
+    except (OSError, ValueError, AttributeError):
+        return None
+    if (not ring.supports(_IORING_OP_MKDIRAT, _IORING_OP_OPENAT, _IORING_OP_CLOSE)
+            or not ring.register_file_slots(_IO_URING_BATCH)):
+        ring.close()
+        return None
+    return ring
+
+
+def _create_with_io_uring(ring, dirs_by_depth, files, total_items, update_callback=None):
+    """
+    Create the planned directories and files in batches through io_uring.
+    
+    Each depth of directories is submitted before the next one, so a parent
+    always exists by the time its children are submitted.
+    
+    Args:
+        ring (_IoUring): The ring used to submit the operations
+        dirs_by_depth (list): Lists of directory paths, one per depth
+        files (list): Paths of the files to create
+        total_items (int): Number of entries to create, used for progress
+        update_callback (callable): Optional callback to update UI with progress
+    """
+    items_created = 0
+    for dirs in dirs_by_depth:
+        for start in range(0, len(dirs), _IO_URING_BATCH):
+            batch = dirs[start:start + _IO_URING_BATCH]
             if update_callback:
-                update_callback(status, items_created / total_items * 100)
+                update_callback(f"Creating directory: {batch[-1]}", items_created / total_items * 100)
             try:
-                # Create parent directories if they don't exist
-                os.makedirs(os.path.dirname(path), exist_ok=True)
-                # Create an empty file
-                open(path, 'w').close()
-                items_created += 1
-            except Exception as e:
+                addresses = ring.path_addresses(batch)
+            except OSError as e:
+                raise RuntimeError(f"Error creating directory {e.filename}: {e}")
+            results = ring.submit_and_wait([
+                (_IORING_OP_MKDIRAT, 0, _AT_FDCWD, addr, 0o777, 0, 0) for addr in addresses
+            ])
+            for path, res in zip(batch, results):
+                # Mirror os.makedirs(exist_ok=True): an existing directory is fine
+                if res < 0 and not (res == -errno.EEXIST and os.path.isdir(path)):
+                    e = OSError(-res, os.strerror(-res), path)
+                    raise RuntimeError(f"Error creating directory {path}: {e}")
+            items_created += len(batch)
+    
+    # Every directory exists now, so files of all depths can share batches
+    for start in range(0, len(files), _IO_URING_BATCH):
+        batch = files[start:start + _IO_URING_BATCH]
+        if update_callback:
+            update_callback(f"Creating file: {batch[-1]}", items_created / total_items * 100)
+        try:
+            addresses = ring.path_addresses(batch)
+        except OSError as e:
+            raise RuntimeError(f"Error creating file {e.filename}: {e}")
+        # Open each file straight into fixed slot N (file_index N + 1) and close
+        # that slot with a linked SQE, so the whole batch needs one submission
+        sqes = []
+        for slot, addr in enumerate(addresses):
+            sqes.append((_IORING_OP_OPENAT, _IOSQE_IO_LINK, _AT_FDCWD, addr, _NEW_FILE_MODE,
+                         _NEW_FILE_FLAGS, slot + 1))
+            sqes.append((_IORING_OP_CLOSE, 0, 0, 0, 0, 0, slot + 1))
+        results = ring.submit_and_wait(sqes)
+        for path, res in zip(batch, results[::2]):
+            if res < 0:
+                e = OSError(-res, os.strerror(-res), path)
                 raise RuntimeError(f"Error creating file {path}: {e}")
+        items_created += len(batch)
+
+
+def _plan_creation(base_path, entries):
+    """
+    Resolve parsed entries into full paths, grouped in creation order.
+    
+    Directories are bucketed by depth so each bucket only depends on the ones
+    before it; files come last since their parents are all created by then.
+    A directory listed more than once is only planned once. This relies on the
+    parsers emitting one path component per entry, with every parent listed
+    before its children (multi-part ASCII names are expanded while parsing).
+    
+    Args:
+        base_path (str): The base path where the structure will be created
+        entries (list): (depth, is_dir, path) tuples as returned by the parsers
+        
+    Returns:
+        tuple: (list - directory paths per depth, list - file paths)
+    """
+    prefix = os.path.join(base_path, '')
+    dirs_by_depth = []
+    files = []
+    add_file = files.append
+    planned_dirs = set()
+    for depth, is_dir, path in entries:
+        if is_dir:
+            if path in planned_dirs:
+                continue
+            planned_dirs.add(path)
+            while len(dirs_by_depth) <= depth:
+                dirs_by_depth.append([])
+            dirs_by_depth[depth].append(prefix + path)
         else:
-            # This is a directory
-            status = f"Creating directory: {path}"
-            if update_callback:
-                update_callback(status, items_created / total_items * 100)
-            try:
-                os.makedirs(path, exist_ok=True)
-                items_created += 1
-                # Recursively create the contents
-                create_directory_structure(path, contents, update_callback)
-            except Exception as e:
-                raise RuntimeError(f"Error creating directory {path}: {e}")
+            add_file(prefix + path)
+    return dirs_by_depth, files
 
 
-def count_items(structure):
-    """Count total number of items (files and directories) in the structure"""
-    count = 0
-    for name, contents in structure.items():
-        if not name.startswith('#'):  # Skip comments
-            count += 1  # Count this item
-            if contents is not None:  # If it's a directory, count its contents
-                count += count_items(contents)
-    return count
+def create_directory_structure(base_path, entries, update_callback=None):
+    """
+    Create the directory structure described by the parsed entries.
+    
+    On Linux the structure is created in batches through io_uring when the kernel
+    supports it; otherwise it falls back to plain os calls.
+    
+    Args:
+        base_path (str): The base path where the structure will be created
+        entries (list): (depth, is_dir, path) tuples as returned by the parsers
+        update_callback (callable): Optional callback to update UI with progress
+    """
+    dirs_by_depth, files = _plan_creation(base_path, entries)
+    total_items = sum(map(len, dirs_by_depth)) + len(files)
+    os.makedirs(base_path, exist_ok=True)
+    ring = _open_io_uring()
+    if ring is not None:
+        with ring:
+            _create_with_io_uring(ring, dirs_by_depth, files, total_items, update_callback)
+        return
+    _create_with_os(dirs_by_depth, files, total_items, update_callback)
+
+
+def _create_empty_file(path):
+    """Create an empty file, truncating it if it already exists"""
+    # A raw open(O_CREAT | O_TRUNC) works on every filesystem, unlike mknod which
+    # fails with EPERM on volumes without mknod support (vfat, exFAT, some FUSE)
+    os.close(os.open(path, _NEW_FILE_FLAGS, _NEW_FILE_MODE))
+
+
+def _create_directory(path):
+    """Create a single directory whose parent already exists"""
+    try:
+        os.mkdir(path)
+    except FileExistsError as e:
+        # Mirror os.makedirs(exist_ok=True): an existing directory is fine
+        if not os.path.isdir(path):
+            raise RuntimeError(f"Error creating directory {path}: {e}")
+    except Exception as e:
+        raise RuntimeError(f"Error creating directory {path}: {e}")
+    return path
+
+
+def _create_file(path):
+    """Create a single empty file whose parent already exists"""
+    try:
+        _create_empty_file(path)
+    except Exception as e:
+        raise RuntimeError(f"Error creating file {path}: {e}")
+    return path
+
+
+def _create_with_os(dirs_by_depth, files, total_items, update_callback=None):
+    """
+    Create the planned directories and files with plain os calls.
+    
+    Each depth, then the files, are created concurrently on a thread pool since
+    siblings don't depend on each other and the os calls release the GIL.
+    
+    Args:
+        dirs_by_depth (list): Lists of directory paths, one per depth
+        files (list): Paths of the files to create
+        total_items (int): Number of entries to create, used for progress
+        update_callback (callable): Optional callback to update UI with progress
+    """
+    # Parents must exist before their children, so each depth is a separate batch
+    batches = [(paths, _create_directory, "Creating directory") for paths in dirs_by_depth]
+    batches.append((files, _create_file, "Creating file"))
+    
+    items_created = 0
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count()) if total_items >= _PARALLEL_THRESHOLD else None
+    try:
+        for paths, create, action in batches:
+            # Small batches aren't worth the pool overhead
+            if executor and len(paths) >= _PARALLEL_THRESHOLD:
+                created = executor.map(create, paths)
+            else:
+                created = map(create, paths)
+            # Results are consumed here so the callback always runs on the calling thread;
+            # it is only called every _PROGRESS_BATCH entries and at the end of each batch
+            for index, path in enumerate(created, 1):
+                if update_callback and (index % _PROGRESS_BATCH == 0 or index == len(paths)):
+                    update_callback(f"{action}: {path}", (items_created + index) / total_items * 100)
+            items_created += len(paths)
+    finally:
+        if executor:
+            executor.shutdown()
 
 
 class DirectoryTreeCreatorApp:
+    __slots__ = (
+        'master', 'progress_queue', 'example_frame', 'ascii_example', 'input_frame',
+        'tree_text', 'output_path', 'progress_var', 'progress', 'status_var',
+        'status_label', 'create_button',
+    )
+    
+    ASCII_EXAMPLE_TEXT = """Example ASCII tree format:
+project/
+├── config.py                    # Configuration settings
+├── main.py                      # Entry point
+├── data/
+│   └── .gitkeep
+└── utils/
+    ├── __init__.py
+    └── logger.py"""
+    
     def __init__(self, master):
         self.master = master
+        self.progress_queue = queue.Queue()
         master.title("Directory Tree Creator")
         master.geometry("800x600")
         master.minsize(600, 400)
@@ -245,10 +661,10 @@ class DirectoryTreeCreatorApp:
         intro_label.pack(fill=tk.X, pady=(0, 10))
         
         # Create example frame with tabs
-        example_frame = ttk.Notebook(main_frame)
+        self.example_frame = ttk.Notebook(main_frame)
         
         # Indented format example
-        indented_example = ttk.Frame(example_frame)
+        indented_example = ttk.Frame(self.example_frame)
         indented_text = """Example indented format:
 project/
     src/
@@ -260,23 +676,19 @@ project/
         indented_label = ttk.Label(indented_example, text=indented_text, justify=tk.LEFT)
         indented_label.pack(fill=tk.BOTH, padx=10, pady=10)
         
-        # ASCII tree format example
-        ascii_example = ttk.Frame(example_frame)
-        ascii_text = """Example ASCII tree format:
-project/
-├── config.py                    # Configuration settings
-├── main.py                      # Entry point
-├── data/
-│   └── .gitkeep
-└── utils/
-    ├── __init__.py
-    └── logger.py"""
-        ascii_label = ttk.Label(ascii_example, text=ascii_text, justify=tk.LEFT)
-        ascii_label.pack(fill=tk.BOTH, padx=10, pady=10)
+        # Give the tabs a fixed height that fits the taller example (plus the label
+        # padding), so filling in the ASCII tab later does not resize the notebook
+        example_lines = max(indented_text.count('\n'), self.ASCII_EXAMPLE_TEXT.count('\n')) + 1
+        line_height = tkfont.nametofont("TkDefaultFont").metrics("linespace")
+        self.example_frame.configure(height=example_lines * line_height + 20)
+        
+        # ASCII tree format example, filled in the first time its tab is shown
+        self.ascii_example = ttk.Frame(self.example_frame)
         
-        example_frame.add(indented_example, text="Indented Format")
-        example_frame.add(ascii_example, text="ASCII Tree Format")
-        example_frame.pack(fill=tk.X, pady=(0, 10))
+        self.example_frame.add(indented_example, text="Indented Format")
+        self.example_frame.add(self.ascii_example, text="ASCII Tree Format")
+        self.example_frame.pack(fill=tk.X, pady=(0, 10))
+        self.example_frame.bind("<<NotebookTabChanged>>", self._build_ascii_tab)
         
         # Create text area for input
         self.input_frame = ttk.LabelFrame(main_frame, text="Directory Tree Input")
@@ -335,6 +747,15 @@ project/
         # Set initial status
         self.status_var.set("Ready. Enter your directory structure above.")
     
+    def _build_ascii_tab(self, event=None):
+        """Fill in the ASCII tree example the first time its tab is selected"""
+        if self.example_frame.select() != str(self.ascii_example):
+            return
+        self.example_frame.unbind("<<NotebookTabChanged>>")
+        
+        ascii_label = ttk.Label(self.ascii_example, text=self.ASCII_EXAMPLE_TEXT, justify=tk.LEFT)
+        ascii_label.pack(fill=tk.BOTH, padx=10, pady=10)
+    
     def setup_styles(self):
         """Set up custom styles for the application"""
         style = ttk.Style()
@@ -390,10 +811,8 @@ project/
                 messagebox.showerror("Error", f"Failed to load file: {e}")
     
     def update_progress(self, status, progress_value):
-        """Update the progress bar and status label"""
-        self.status_var.set(status)
-        self.progress_var.set(progress_value)
-        self.master.update_idletasks()  # Force update of the UI
+        """Queue a progress update from the worker thread for the Tk thread to apply"""
+        self.progress_queue.put((status, progress_value))
     
     def create_structure(self):
         """Parse the tree and create the directory structure"""
@@ -450,37 +869,72 @@ project/
         
         try:
             # Parse the tree
-            structure, format_type = detect_format_and_parse(tree_text)
-            
-            # Show what we detected
-            self.status_var.set(f"Detected {format_type} format. Creating structure...")
-            self.master.update_idletasks()  # Force update of the UI
-            
-            # Create the structure
+            entries, format_type = detect_format_and_parse(tree_text)
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            self.status_var.set(f"Error: {e}")
+            self._end_creation()
+            return
+        
+        # Show what we detected
+        self.status_var.set(f"Detected {format_type} format. Creating structure...")
+        self.progress_var.set(0)
+        
+        # Create the structure on a worker thread so file system calls never wait on
+        # Tk redraws; progress is handed back through the queue and polled below
+        worker = threading.Thread(target=self._run_creation, args=(output_path, entries), daemon=True)
+        worker.start()
+        self.master.after(_PROGRESS_POLL_MS, self._drain_progress, output_path)
+    
+    def _run_creation(self, output_path, entries):
+        """Create the structure on the worker thread and queue the outcome"""
+        try:
+            create_directory_structure(output_path, entries, self.update_progress)
+        except Exception as e:
+            self.progress_queue.put((_CREATION_FINISHED, e))
+        else:
+            self.progress_queue.put((_CREATION_FINISHED, None))
+    
+    def _drain_progress(self, output_path):
+        """Apply queued progress updates, polling again until the worker finishes"""
+        while True:
             try:
-                create_directory_structure(output_path, structure, self.update_progress)
-            except PermissionError:
+                status, value = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if status is _CREATION_FINISHED:
+                self._report_creation(output_path, value)
+                return
+            self.status_var.set(status)
+            self.progress_var.set(value)
+        self.master.after(_PROGRESS_POLL_MS, self._drain_progress, output_path)
+    
+    def _report_creation(self, output_path, error):
+        """Show the outcome of the worker thread and restore the UI"""
+        try:
+            if error is None:
+                # Show success message
+                messagebox.showinfo(
+                    "Success", 
+                    f"Directory structure created successfully in:\n{os.path.abspath(output_path)}"
+                )
+                self.status_var.set("Directory structure created successfully.")
+            elif isinstance(error, PermissionError):
                 messagebox.showerror(
                     "Permission Denied", 
                     "Permission denied while creating files or directories.\n\n"
                     "Please select a different location or run the application with elevated privileges."
                 )
-                return
-            
-            # Show success message
-            messagebox.showinfo(
-                "Success", 
-                f"Directory structure created successfully in:\n{os.path.abspath(output_path)}"
-            )
-            self.status_var.set("Directory structure created successfully.")
-            
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-            self.status_var.set(f"Error: {e}")
+            else:
+                messagebox.showerror("Error", str(error))
+                self.status_var.set(f"Error: {error}")
         finally:
-            # Re-enable buttons and hide progress bar
-            self.create_button.configure(state=tk.NORMAL)
-            self.progress.pack_forget()  # Hide progress bar
+            self._end_creation()
+    
+    def _end_creation(self):
+        """Re-enable buttons and hide progress bar"""
+        self.create_button.configure(state=tk.NORMAL)
+        self.progress.pack_forget()  # Hide progress bar
 
 
 def main():
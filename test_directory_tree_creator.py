@@ -0,0 +1,195 @@
+"""
+Checks for Directory Tree Creator's parsing and creation backends.
+
+Run with: python -m unittest test_directory_tree_creator
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+
+
+# The application script has a hyphenated name, so it is loaded by path
+_spec = importlib.util.spec_from_file_location(
+    "directory_tree_creator",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "directory-tree-creator.py"),
+)
+dtc = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(dtc)
+
+
+MULTI_PART_ASCII_TREE = """project/
+├── src/utils/helpers.py
+├── docs/api/
+│   └── index.md
+└── README.md"""
+
+
+def _native(entries):
+    """Turn the '/'-separated paths of expected entries into native paths"""
+    return [(depth, is_dir, path.replace("/", os.sep)) for depth, is_dir, path in entries]
+
+
+class IndentedParserTest(unittest.TestCase):
+    """parse_indented_tree must nest every entry below the right directory"""
+
+    CASES = [
+        (
+            "GUI example",
+            "project/\n    src/\n        main.py\n        utils.py\n    docs/\n        index.md\n    README.md",
+            [
+                (0, True, "project"),
+                (1, True, "project/src"),
+                (2, False, "project/src/main.py"),
+                (2, False, "project/src/utils.py"),
+                (1, True, "project/docs"),
+                (2, False, "project/docs/index.md"),
+                (1, False, "project/README.md"),
+            ],
+        ),
+        (
+            "3-column indents",
+            "a/\n   b/\n      c.txt\n   d.txt\ne.txt",
+            [(0, True, "a"), (1, True, "a/b"), (2, False, "a/b/c.txt"), (1, False, "a/d.txt"), (0, False, "e.txt")],
+        ),
+        (
+            "comment lines and duplicate directories",
+            "# layout\nsrc/\n    a.py\n    # more later\n\nsrc/\n    b.py",
+            [(0, True, "src"), (1, False, "src/a.py"), (0, True, "src"), (1, False, "src/b.py")],
+        ),
+    ]
+
+    INVALID_NAMES = ["a/\n    b\\c", "a/\n    b//", "/"]
+
+    def test_cases(self):
+        for name, tree_text, expected in self.CASES:
+            with self.subTest(name):
+                self.assertEqual(dtc.parse_indented_tree(tree_text), _native(expected))
+
+    def test_invalid_names(self):
+        for tree_text in self.INVALID_NAMES:
+            with self.subTest(tree_text):
+                with self.assertRaises(ValueError):
+                    dtc.parse_indented_tree(tree_text)
+
+
+@unittest.skipIf(dtc._compiled_parse_indented_tree is None, "_parser is not built")
+class CompiledParserTest(unittest.TestCase):
+    """The compiled _parser must produce the same result as the Python parser"""
+
+    def test_same_entries(self):
+        for name, tree_text, _ in IndentedParserTest.CASES:
+            with self.subTest(name):
+                self.assertEqual(
+                    dtc._compiled_parse_indented_tree(tree_text), dtc.parse_indented_tree(tree_text)
+                )
+
+    def test_same_invalid_names(self):
+        for tree_text in IndentedParserTest.INVALID_NAMES:
+            with self.subTest(tree_text):
+                with self.assertRaises(ValueError):
+                    dtc._compiled_parse_indented_tree(tree_text)
+
+
+class AsciiParserTest(unittest.TestCase):
+    """parse_ascii_tree must nest every entry below the right directory"""
+
+    CASES = [
+        (
+            "GUI example",
+            # Drop the "Example ASCII tree format:" heading
+            dtc.DirectoryTreeCreatorApp.ASCII_EXAMPLE_TEXT.split("\n", 1)[1],
+            [
+                (0, False, "config.py"),
+                (0, False, "main.py"),
+                (0, True, "data"),
+                (1, False, "data/.gitkeep"),
+                (0, True, "utils"),
+                (1, False, "utils/__init__.py"),
+                (1, False, "utils/logger.py"),
+            ],
+        ),
+        (
+            "3-column indents and spacer lines",
+            "project/\n├─ a/\n│  ├─ b.py\n│  │\n│  └─ c/\n│     └─ d.txt\n│\n└─ e.md",
+            [(0, True, "a"), (1, False, "a/b.py"), (1, True, "a/c"), (2, False, "a/c/d.txt"), (0, False, "e.md")],
+        ),
+        (
+            "comment lines and duplicate directories",
+            "project/\n# sources first\n├── src/    # code\n│   └── a.py\n├── src/\n│   └── b.py\n└── README.md",
+            [(0, True, "src"), (1, False, "src/a.py"), (0, True, "src"), (1, False, "src/b.py"), (0, False, "README.md")],
+        ),
+        (
+            "root line without a slash",
+            "project\n├── a.py",
+            [(0, False, "project"), (0, False, "a.py")],
+        ),
+        (
+            "unmarked directory with marked children",
+            "project/\nsrc/\n├── a.py\n└── b.py",
+            [(0, True, "src"), (1, False, "src/a.py"), (1, False, "src/b.py")],
+        ),
+    ]
+
+    def test_cases(self):
+        for name, tree_text, expected in self.CASES:
+            with self.subTest(name):
+                self.assertEqual(dtc.parse_ascii_tree(tree_text), _native(expected))
+
+
+class PlanCreationTest(unittest.TestCase):
+    """_plan_creation must plan each directory once, at a depth after its parent"""
+
+    def test_duplicate_directories_are_planned_once(self):
+        entries = dtc.parse_indented_tree("src/\n    a.py\nsrc/\n    b.py")
+        dirs_by_depth, files = dtc._plan_creation("base", entries)
+        self.assertEqual(dirs_by_depth, [[os.path.join("base", "src")]])
+        self.assertEqual(sorted(files), [os.path.join("base", "src", name) for name in ("a.py", "b.py")])
+
+    def test_multi_part_names_plan_their_parents(self):
+        entries, _ = dtc.detect_format_and_parse(MULTI_PART_ASCII_TREE)
+        dirs_by_depth, files = dtc._plan_creation("base", entries)
+        planned = {os.path.join("base", "")}
+        for dirs in dirs_by_depth:
+            for path in dirs:
+                self.assertIn(os.path.dirname(path) + os.sep, planned)
+            planned.update(path + os.sep for path in dirs)
+        for path in files:
+            self.assertIn(os.path.dirname(path) + os.sep, planned)
+
+
+class MultiPartNameTest(unittest.TestCase):
+    """Multi-part ASCII names must create their intermediate directories"""
+
+    def assert_created(self, create):
+        entries, _ = dtc.detect_format_and_parse(MULTI_PART_ASCII_TREE)
+        with tempfile.TemporaryDirectory() as base_path:
+            create(base_path, entries)
+            join = os.path.join
+            self.assertTrue(os.path.isfile(join(base_path, "src", "utils", "helpers.py")))
+            self.assertTrue(os.path.isfile(join(base_path, "docs", "api", "index.md")))
+            self.assertTrue(os.path.isfile(join(base_path, "README.md")))
+
+    def test_os_backend(self):
+        def create(base_path, entries):
+            dirs_by_depth, files = dtc._plan_creation(base_path, entries)
+            total_items = sum(map(len, dirs_by_depth)) + len(files)
+            dtc._create_with_os(dirs_by_depth, files, total_items)
+        self.assert_created(create)
+
+    def test_io_uring_backend(self):
+        ring = dtc._open_io_uring()
+        if ring is None:
+            self.skipTest("io_uring is not available")
+
+        def create(base_path, entries):
+            dirs_by_depth, files = dtc._plan_creation(base_path, entries)
+            total_items = sum(map(len, dirs_by_depth)) + len(files)
+            dtc._create_with_io_uring(ring, dirs_by_depth, files, total_items)
+        with ring:
+            self.assert_created(create)
+
+
+if __name__ == "__main__":
+    unittest.main()